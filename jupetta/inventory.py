@@ -0,0 +1,78 @@
+"""
+Fast path for the flat ``devices.yaml`` inventory
+
+Used when PyYAML is built without libyaml, so the pure‑Python SafeLoader can
+be skipped for the documented shape::
+
+    - device_type: cisco_ios
+      host: 192.168.1.1
+      username: admin
+      password: password
+
+Anything the fast path cannot reproduce exactly (quotes, nesting, flow
+style, scalars YAML would type as null / float / octal ...) is handed to
+``yaml.safe_load``, so the result always equals what YAML would return.
+"""
+
+from __future__ import annotations
+
+import re
+
+import yaml
+
+_RESOLVER = yaml.resolver.Resolver()
+_DECIMAL_RE = re.compile(r"0|[1-9][0-9]*")
+_KEY_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+# characters that start non-plain YAML (quotes, anchors, tags, flow, blocks ...)
+_SPECIAL_START = set("'\"&*!|>%@`[]{},?-")
+
+
+class _Fallback(Exception):
+    pass
+
+
+def _scalar(value: str):
+    if not value or value[0] in _SPECIAL_START or ": " in value or value.endswith(":"):
+        raise _Fallback
+    if "'" in value or '"' in value or "\t" in value:
+        raise _Fallback
+    tag = _RESOLVER.resolve(yaml.ScalarNode, value, (True, False))
+    if tag == "tag:yaml.org,2002:str":
+        return value
+    if tag == "tag:yaml.org,2002:int" and _DECIMAL_RE.fullmatch(value):
+        return int(value)
+    if tag == "tag:yaml.org,2002:bool" and value.lower() in ("true", "false"):
+        return value.lower() == "true"
+    raise _Fallback
+
+
+def _parse_flat(text: str) -> list:
+    devices: list[dict] = []
+    for raw in text.splitlines():
+        if "'" in raw or '"' in raw:
+            raise _Fallback
+        line = raw.split(" #", 1)[0].rstrip()
+        if not line.strip() or line.startswith("#"):
+            continue
+        if line.startswith("- "):
+            devices.append({})
+            line = line[2:]
+        elif not devices or not line.startswith("  ") or line[2] == " ":
+            raise _Fallback
+        else:
+            line = line[2:]
+        key, sep, value = line.partition(": ")
+        if not sep or not _KEY_RE.fullmatch(key):
+            raise _Fallback
+        devices[-1][key] = _scalar(value.strip())
+    if not devices:
+        raise _Fallback
+    return devices
+
+
+def parse_device_yaml(text: str) -> list:
+    """Parse ``devices.yaml`` text; same result as ``yaml.safe_load``."""
+    try:
+        return _parse_flat(text)
+    except _Fallback:
+        return yaml.safe_load(text)
@@ -8,30 +8,53 @@ Capabilities
 * **RouteProto**: inspect BGP/OSPF neighbor / summary state
 * **Ping**: ping from router to target IP (5 packets, default)
 * **IfaceConfig**: shut / no‑shut interface with pre‑check (idempotent)
+* **BatchRead**: run several read‑only tools above in parallel
 
 Design Notes
 * Each tool is small, single‑responsibility, Pydantic‑v2 compliant
-* Netmiko connections managed via `with` context
-* No file writes – stdout only for simplicity
+* Netmiko sessions checked out from a small per‑host pool and reused
+* Read‑only tool results cached with a per‑tool TTL; config changes flush it
+* LLM completions cached on disk (``.langchain.db``) across runs
+* Output goes to stdout only; the sole file written is the LLM cache
 """
 
 from __future__ import annotations
 
 import asyncio
+import atexit
+import contextlib
+import functools
+import inspect
 import os
 import re
+import signal
+import sys
+import threading
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import ClassVar, Literal, Optional
+from typing import TYPE_CHECKING, ClassVar, Iterator, Literal, Optional
 from zoneinfo import ZoneInfo
 
 import yaml
-from dotenv import load_dotenv
-from langchain import hub
-from langchain.agents import AgentExecutor, create_react_agent
+from cachetools import TTLCache
 from langchain.tools import BaseTool
-from langchain_openai import ChatOpenAI
-from netmiko import ConnectHandler
+from pydantic import BaseModel, Field, ValidationError
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # libyaml not available; see inventory.parse_device_yaml
+    _YamlLoader = None
+
+try:
+    from .inventory import parse_device_yaml
+except ImportError:  # run as a script: ``cd jupetta && python main.py``
+    from inventory import parse_device_yaml  # type: ignore[no-redef]
+
+if TYPE_CHECKING:
+    from langchain.agents import AgentExecutor
+    from netmiko import ConnectHandler
 
 # -----------------------------------------------------------------------------
 # Configuration helpers
@@ -40,20 +63,38 @@ from netmiko import ConnectHandler
 TZ_TOKYO = ZoneInfo("Asia/Tokyo")
 BASE_DIR = Path(__file__).resolve().parent
 
-load_dotenv()
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-if not OPENAI_API_KEY:
-    raise EnvironmentError("OPENAI_API_KEY is not set in environment or .env file")
+
+class Settings(BaseSettings):
+    """Environment / ``.env`` configuration, parsed once at import."""
+
+    model_config = SettingsConfigDict(env_file=BASE_DIR / ".env", extra="allow", frozen=True)
+
+    openai_api_key: str = Field(min_length=1)
+    device_type: str = "cisco_ios"
+    device_host: Optional[str] = None
+    device_username: Optional[str] = None
+    device_password: Optional[str] = None
+
+
+try:
+    SETTINGS = Settings()
+except ValidationError as e:
+    raise EnvironmentError("OPENAI_API_KEY is not set in environment or .env file") from e
+
+# other .env entries (LANGCHAIN_API_KEY, OPENAI_BASE_URL, ...) are read from
+# os.environ by langchain / the OpenAI SDK; real environment variables win
+for _key, _value in (SETTINGS.model_extra or {}).items():
+    os.environ.setdefault(_key.upper(), str(_value))
 
 
 # inventory loader
 
 def load_device_from_env() -> dict:
     return {
-        "device_type": os.getenv("DEVICE_TYPE", "cisco_ios"),
-        "host": os.getenv("DEVICE_HOST"),
-        "username": os.getenv("DEVICE_USERNAME"),
-        "password": os.getenv("DEVICE_PASSWORD"),
+        "device_type": SETTINGS.device_type,
+        "host": SETTINGS.device_host,
+        "username": SETTINGS.device_username,
+        "password": SETTINGS.device_password,
     }
 
 
@@ -61,10 +102,14 @@ def load_device_from_yaml(path: Path) -> dict | None:
     if not path.exists():
         return None
     with path.open("r", encoding="utf-8") as f:
-        devices = yaml.safe_load(f)
+        if _YamlLoader is not None:
+            devices = yaml.load(f, Loader=_YamlLoader)
+        else:
+            devices = parse_device_yaml(f.read())
     return devices[0] if isinstance(devices, list) and devices else None
 
 
+@functools.lru_cache(maxsize=1)
 def get_device() -> dict:
     device = load_device_from_yaml(BASE_DIR / "devices.yaml") or load_device_from_env()
     required = {"host", "username", "password", "device_type"}
@@ -80,36 +125,256 @@ DEVICE = get_device()
 # Utility funcs
 # -----------------------------------------------------------------------------
 
-VERSION_REGEX = re.compile(r"Version\s+([A-Za-z0-9.()]+)")
+VERSION_REGEX = re.compile(r"^.*?Version\s+([A-Za-z0-9.()]+)", re.MULTILINE)
 
 
 def extract_version(show_ver_output: str) -> str:
-    for line in show_ver_output.splitlines():
-        if "Version" in line:
-            m = VERSION_REGEX.search(line)
-            return m.group(1) if m else line.strip()
-    return "[Version line not found]"
+    m = VERSION_REGEX.search(show_ver_output)
+    return m.group(1) if m else "[Version line not found]"
+
+
+def parsed_version(output: str | list) -> str:
+    """Version from a TextFSM-parsed ``show version``; regex fallback on raw text."""
+    if isinstance(output, list) and output and isinstance(output[0], dict):
+        version = output[0].get("version")
+        if version:
+            return version
+    return extract_version(output) if isinstance(output, str) else "[Version line not found]"
+
+
+# -----------------------------------------------------------------------------
+# Connection pool
+# -----------------------------------------------------------------------------
+
+# Netmiko channels are not safe to share, so each call checks a session out
+# and returns it afterwards. At most POOL_SIZE sessions are open per host,
+# leaving one line free on a stock ``line vty 0 4`` for operators.
+POOL_SIZE = 4
+
+
+class _HostPool:
+    def __init__(self, size: int) -> None:
+        self.slots = threading.BoundedSemaphore(size)
+        self.idle: list[ConnectHandler] = []
+
+
+_POOLS: dict[str, _HostPool] = {}
+_OPEN_CONNS: set[ConnectHandler] = set()
+# guards only the dict/list/set bookkeeping above; never held across network I/O
+_CONN_LOCK = threading.Lock()
+
+
+def _host_pool(host: str) -> _HostPool:
+    with _CONN_LOCK:
+        return _POOLS.setdefault(host, _HostPool(POOL_SIZE))
+
+
+@contextlib.contextmanager
+def pooled_conn(device: dict) -> Iterator[ConnectHandler]:
+    """Check out a live Netmiko session for *device*, connecting only if needed.
+
+    Blocks while POOL_SIZE sessions to the host are in use. A session that
+    raised is discarded rather than returned to the pool.
+    """
+    from netmiko import ConnectHandler
+
+    pool = _host_pool(device["host"])
+    with pool.slots:
+        with _CONN_LOCK:
+            conn = pool.idle.pop() if pool.idle else None
+        if conn is not None and not conn.is_alive():
+            _discard(conn)
+            conn = None
+        if conn is None:
+            conn = ConnectHandler(**device)
+            with _CONN_LOCK:
+                _OPEN_CONNS.add(conn)
+        try:
+            yield conn
+        except Exception:
+            _discard(conn)
+            raise
+        # SystemExit / KeyboardInterrupt propagate without a blocking disconnect:
+        # the session stays in _OPEN_CONNS for _close_all_pooled's bounded close
+        with _CONN_LOCK:
+            pool.idle.append(conn)
+
+
+def _discard(conn: ConnectHandler) -> None:
+    with _CONN_LOCK:
+        _OPEN_CONNS.discard(conn)
+    _disconnect_quietly(conn)
+
+
+def _disconnect_quietly(conn: ConnectHandler) -> None:
+    try:
+        conn.disconnect()
+    except Exception:
+        pass
+
+
+def _close_all_pooled(timeout: float = 1.0) -> None:
+    """Disconnect pooled sessions, waiting at most *timeout* seconds in total."""
+    with _CONN_LOCK:
+        conns = list(_OPEN_CONNS)
+        _OPEN_CONNS.clear()
+        for pool in _POOLS.values():
+            pool.idle.clear()
+    # daemon threads so a hung transport cannot block interpreter shutdown
+    closers = [threading.Thread(target=_disconnect_quietly, args=(c,), daemon=True) for c in conns]
+    for t in closers:
+        t.start()
+    deadline = time.monotonic() + timeout
+    for t in closers:
+        t.join(max(0.0, deadline - time.monotonic()))
+
+
+def _on_sigterm(signum, frame) -> None:
+    # no cleanup here: the handler may interrupt code holding _CONN_LOCK.
+    # SystemExit unwinds those ``with`` blocks, then the atexit hook closes the pool.
+    sys.exit(0)
+
+
+atexit.register(_close_all_pooled)
+
+
+# -----------------------------------------------------------------------------
+# Tool result cache
+# -----------------------------------------------------------------------------
+
+_TOOL_CACHES: list[TTLCache] = []
+_CACHE_LOCK = threading.Lock()
+# bumped by clear_tool_cache(); a read that overlapped a config change must not
+# store its (possibly stale) output
+_CACHE_GEN = 0
+
+
+def tool_cache(ttl: float, key=None):
+    """Memoize a tool's ``_run`` per (tool, args, host) for *ttl* seconds.
+
+    *key*, if given, maps the ``_run`` arguments to the value that identifies
+    the result (e.g. the resolved CLI command), so "IPv6" / "ipv6" /
+    ``protocol="ipv6"`` share one entry. ``ttl <= 0`` disables caching.
+    ``[ERROR]`` results are never stored.
+    """
+
+    def decorator(func):
+        if ttl <= 0:
+            return func
+        cache: TTLCache = TTLCache(maxsize=256, ttl=ttl)
+        _TOOL_CACHES.append(cache)
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            call = key(*args, **kwargs) if key else (args, tuple(sorted(kwargs.items())))
+            cache_key = (type(self).__name__, call, DEVICE["host"])
+            with _CACHE_LOCK:
+                hit = cache.get(cache_key)
+                gen = _CACHE_GEN
+            if hit is not None:
+                return hit
+            result = func(self, *args, **kwargs)
+            if not result.startswith("[ERROR]"):
+                with _CACHE_LOCK:
+                    if gen == _CACHE_GEN:
+                        cache[cache_key] = result
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def clear_tool_cache() -> None:
+    global _CACHE_GEN
+    with _CACHE_LOCK:
+        _CACHE_GEN += 1
+        for cache in _TOOL_CACHES:
+            cache.clear()
+
+
+# -----------------------------------------------------------------------------
+# Tool argument schemas
+# -----------------------------------------------------------------------------
+
+# Fields are plain ``str`` so loosely formatted ReAct input ("IPv4", "BGP")
+# still validates; each tool normalizes the value itself.
+
+
+class _NoArgs(BaseModel):
+    pass
+
+
+class _RTArgs(BaseModel):
+    protocol: str = Field("ipv4", description="'ipv4' or 'ipv6'")
+
+
+class _ProtoArgs(BaseModel):
+    proto: str = Field("bgp", description="'bgp' or 'ospf'")
+
+
+class _PingArgs(BaseModel):
+    target: str = Field(description="target IP address")
+
+
+class _IfaceArgs(BaseModel):
+    command: str = Field(description="'<iface> shutdown' or '<iface> noshutdown'")
+
+
+class _BatchArgs(BaseModel):
+    spec: str = Field(description="'<tool> [arg]' entries separated by ';'")
 
 
 # -----------------------------------------------------------------------------
 # Tool implementations
 # -----------------------------------------------------------------------------
 
+# Stop reading as soon as the exec prompt ('Router>' / 'Router#') comes back
+PROMPT_PATTERN = r"[>#]\s*$"
+
+# matches a bare 'shutdown' line but not 'no shutdown'
+_SHUT_RE = re.compile(r"^\s*shutdown\s*$", re.MULTILINE)
+
+_RT_CMDS = {
+    "ipv4": "show ip route",
+    "ipv6": "show ipv6 route",
+}
+
+_PROTO_CMDS = {
+    "bgp": "show ip bgp summary",
+    "ospf": "show ip ospf neighbor",
+}
+
+
+def _route_table_cmd(protocol: str = "ipv4") -> str:
+    return _RT_CMDS.get(str(protocol).lower(), _RT_CMDS["ipv4"])
+
+
+def _proto_cmd(proto: str = "bgp") -> str | None:
+    return _PROTO_CMDS.get(str(proto).lower())
+
+
 class GetVersionTool(BaseTool):
     name: ClassVar[str] = "GetVersion"
     description: ClassVar[str] = "Cisco IOS から 'show version' を実行し、ソフトウェアのバージョン番号のみを返す。引数不要。"
+    args_schema: ClassVar[type[BaseModel]] = _NoArgs
 
+    @tool_cache(ttl=3600)
     def _run(self) -> str:  # type: ignore[override]
         try:
-            with ConnectHandler(**DEVICE) as conn:
-                output = conn.send_command("show version")
-            return extract_version(output)
+            with pooled_conn(DEVICE) as conn:
+                output = conn.send_command(
+                    "show version",
+                    expect_string=PROMPT_PATTERN,
+                    read_timeout=5,
+                    use_textfsm=True,
+                )
+                return parsed_version(output)
         except Exception as e:
             return f"[ERROR] {e}"
 
     async def _arun(self):  # type: ignore[override]
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self._run)
+        return await asyncio.to_thread(self._run)
 
 
 class GetRouteTableTool(BaseTool):
@@ -117,18 +382,20 @@ class GetRouteTableTool(BaseTool):
     description: ClassVar[str] = (
         "IPv4/IPv6 ルーティングテーブルを取得するツール。input は 'ipv4' または 'ipv6'。省略時は ipv4。"
     )
+    args_schema: ClassVar[type[BaseModel]] = _RTArgs
 
+    @tool_cache(ttl=30, key=_route_table_cmd)
     def _run(self, protocol: Literal["ipv4", "ipv6"] | str = "ipv4") -> str:  # type: ignore[override]
-        cmd = "show ip route" if str(protocol).lower() != "ipv6" else "show ipv6 route"
+        cmd = _route_table_cmd(protocol)
         try:
-            with ConnectHandler(**DEVICE) as conn:
-                return conn.send_command(cmd)
+            with pooled_conn(DEVICE) as conn:
+                # full route tables can be large; allow more time than other show commands
+                return conn.send_command(cmd, expect_string=PROMPT_PATTERN, read_timeout=20)
         except Exception as e:
             return f"[ERROR] {e}"
 
     async def _arun(self, protocol: str = "ipv4") -> str:  # type: ignore[override]
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self._run, protocol)
+        return await asyncio.to_thread(self._run, protocol)
 
 
 class GetRouteProtoStateTool(BaseTool):
@@ -136,25 +403,21 @@ class GetRouteProtoStateTool(BaseTool):
     description: ClassVar[str] = (
         "動的ルーティングプロトコル (BGP/OSPF) の状態を確認。input は 'bgp' or 'ospf'。"
     )
+    args_schema: ClassVar[type[BaseModel]] = _ProtoArgs
 
-    _cmd_map = {
-        "bgp": "show ip bgp summary",
-        "ospf": "show ip ospf neighbor",
-    }
-
+    @tool_cache(ttl=30, key=_proto_cmd)
     def _run(self, proto: Literal["bgp", "ospf"] | str = "bgp") -> str:  # type: ignore[override]
-        cmd = self._cmd_map.get(str(proto).lower())
+        cmd = _proto_cmd(proto)
         if cmd is None:
             return "[ERROR] proto must be 'bgp' or 'ospf'"
         try:
-            with ConnectHandler(**DEVICE) as conn:
-                return conn.send_command(cmd)
+            with pooled_conn(DEVICE) as conn:
+                return conn.send_command(cmd, expect_string=PROMPT_PATTERN, read_timeout=5)
         except Exception as e:
             return f"[ERROR] {e}"
 
     async def _arun(self, proto: str = "bgp") -> str:  # type: ignore[override]
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self._run, proto)
+        return await asyncio.to_thread(self._run, proto)
 
 
 class PingTool(BaseTool):
@@ -162,17 +425,18 @@ class PingTool(BaseTool):
     description: ClassVar[str] = (
         "ルーターから指定 IP へ ping を実行 (5 回)。input は target IP アドレス。"
     )
+    args_schema: ClassVar[type[BaseModel]] = _PingArgs
 
+    @tool_cache(ttl=0)
     def _run(self, target: str) -> str:  # type: ignore[override]
         try:
-            with ConnectHandler(**DEVICE) as conn:
-                return conn.send_command(f"ping {target}")
+            with pooled_conn(DEVICE) as conn:
+                return conn.send_command(f"ping {target}", expect_string=PROMPT_PATTERN, read_timeout=15)
         except Exception as e:
             return f"[ERROR] {e}"
 
     async def _arun(self, target: str) -> str:  # type: ignore[override]
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self._run, target)
+        return await asyncio.to_thread(self._run, target)
 
 
 class IfaceConfigTool(BaseTool):
@@ -180,21 +444,25 @@ class IfaceConfigTool(BaseTool):
     description: ClassVar[str] = (
         "インターフェースを shut / no shut する。input は 'GigabitEthernet0/1 shutdown' / 'GigabitEthernet0/1 noshutdown' の形式。"
     )
+    args_schema: ClassVar[type[BaseModel]] = _IfaceArgs
 
     def _run(self, command: str) -> str:  # type: ignore[override]
         try:
             iface, action = command.split(maxsplit=1)
             desired = "shutdown" if action.lower().startswith("shut") else "no shutdown"
-            with ConnectHandler(**DEVICE) as conn:
-                current_cfg = conn.send_command(f"show run interface {iface}")
-                already = ("shutdown" in current_cfg) == (desired == "shutdown")
+            with pooled_conn(DEVICE) as conn:
+                current_cfg = conn.send_command(
+                    f"show run interface {iface} | include shutdown",
+                    expect_string=PROMPT_PATTERN,
+                    read_timeout=5,
+                )
+                is_shut = bool(_SHUT_RE.search(current_cfg))
+                already = is_shut == (desired == "shutdown")
                 if already:
                     return f"[SKIP] {iface} は既に {desired} 状態です。"
                 conn.enable()
-                conn.config_mode()
-                conn.send_command(f"interface {iface}")
-                conn.send_command(desired)
-                conn.exit_config_mode()
+                conn.send_config_set([f"interface {iface}", desired], exit_config_mode=True, read_timeout=10)
+                clear_tool_cache()
                 return f"[OK] {iface} を {desired} しました。"
         except ValueError:
             return "[ERROR] input format: '<iface> shutdown|noshutdown'"
@@ -202,32 +470,151 @@ class IfaceConfigTool(BaseTool):
             return f"[ERROR] {e}"
 
     async def _arun(self, command: str) -> str:  # type: ignore[override]
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self._run, command)
+        return await asyncio.to_thread(self._run, command)
+
+
+_READ_TOOLS: dict[str, BaseTool] = {
+    t.name: t for t in (GetVersionTool(), GetRouteTableTool(), GetRouteProtoStateTool(), PingTool())
+}
+
+
+def _arity(tool: BaseTool) -> tuple[int, int]:
+    """(min, max) positional arguments accepted by ``tool._run``."""
+    params = list(inspect.signature(tool._run).parameters.values())
+    return sum(p.default is p.empty for p in params), len(params)
+
+
+_READ_ARITY = {name: _arity(tool) for name, tool in _READ_TOOLS.items()}
+
+# (label, tool, args, error) – *error* is set instead of running *tool*
+BatchCall = tuple[str, Optional[BaseTool], tuple[str, ...], Optional[str]]
+
+
+def parse_batch_spec(spec: str) -> list[BatchCall]:
+    """Parse ``'GetRouteTable ipv4; GetRouteProtoState bgp'`` into batch calls.
+
+    Unknown tools and wrong argument counts become per-entry ``[ERROR]`` results.
+    """
+    calls: list[BatchCall] = []
+    for entry in spec.split(";"):
+        label = entry.strip()
+        name, _, arg = label.partition(" ")
+        if not name:
+            continue
+        args = (arg.strip(),) if arg.strip() else ()
+        tool = _READ_TOOLS.get(name)
+        if tool is None:
+            calls.append((label, None, args, f"[ERROR] unknown tool: {name}"))
+            continue
+        lo, hi = _READ_ARITY[name]
+        if not lo <= len(args) <= hi:
+            usage = "no argument" if hi == 0 else "one argument"
+            calls.append((label, None, args, f"[ERROR] {name} takes {usage}"))
+            continue
+        calls.append((label, tool, args, None))
+    return calls
+
+
+def _run_batch_threads(calls: list[BatchCall]) -> list[str]:
+    """Run *calls* concurrently; session count is bounded by the pool itself.
+
+    Daemon threads rather than a ThreadPoolExecutor: interpreter shutdown
+    joins executor workers before atexit runs, so an in-flight
+    ``send_command`` would hold up exit on SIGTERM.
+    """
+    results = [error or "" for _, _, _, error in calls]
+
+    def work(i: int, tool: BaseTool, args: tuple[str, ...]) -> None:
+        results[i] = tool._run(*args)
+
+    threads = [
+        threading.Thread(target=work, args=(i, tool, args), name="batch-read", daemon=True)
+        for i, (_, tool, args, error) in enumerate(calls)
+        if not error
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
+def format_batch(calls: list[BatchCall], results: list[str]) -> str:
+    return "\n\n".join(f"### {call[0]}\n{result}" for call, result in zip(calls, results))
+
+
+class BatchReadTool(BaseTool):
+    name: ClassVar[str] = "BatchRead"
+    description: ClassVar[str] = (
+        "複数の参照系ツール (GetVersion / GetRouteTable / GetRouteProtoState / Ping) を並列に実行する。"
+        "input は 'GetRouteTable ipv4; GetRouteProtoState bgp' のように '<ツール名> [引数]' を ';' で区切る。"
+    )
+    args_schema: ClassVar[type[BaseModel]] = _BatchArgs
+
+    def _run(self, spec: str) -> str:  # type: ignore[override]
+        calls = parse_batch_spec(spec)
+        return format_batch(calls, _run_batch_threads(calls))
+
+    async def _arun(self, spec: str) -> str:  # type: ignore[override]
+        async def run_one(call: BatchCall) -> str:
+            _, tool, args, error = call
+            return error if error else await tool._arun(*args)
+
+        calls = parse_batch_spec(spec)
+        results = await asyncio.gather(*(run_one(c) for c in calls))
+        return format_batch(calls, list(results))
 
 
 # -----------------------------------------------------------------------------
 # Agent setup
 # -----------------------------------------------------------------------------
 
-prompt = hub.pull("hwchase17/react")
-llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.0)
-
 tools = [
-    GetVersionTool(),
-    GetRouteTableTool(),
-    GetRouteProtoStateTool(),
-    PingTool(),
+    *_READ_TOOLS.values(),
     IfaceConfigTool(),
+    BatchReadTool(),
 ]
 
-agent = create_react_agent(llm, tools, prompt)
-agent_executor = AgentExecutor(
-    agent=agent,
-    tools=tools,
-    verbose=True,
-    handle_parsing_errors=True,
-)
+
+@functools.lru_cache(maxsize=None)
+def _react_prompt(name: str = "hwchase17/react"):
+    from langchain import hub
+
+    return hub.pull(name)
+
+
+def _build_agent() -> AgentExecutor:
+    # langchain hub / OpenAI SDK are heavy; import only when the agent is needed
+    import httpx
+    from langchain.agents import AgentExecutor, create_react_agent
+    from langchain.globals import set_llm_cache
+    from langchain_community.cache import SQLiteCache
+    from langchain_openai import ChatOpenAI
+
+    set_llm_cache(SQLiteCache(database_path=str(BASE_DIR / ".langchain.db")))
+    prompt = _react_prompt()
+    # one keep-alive HTTP/2 connection shared by every LLM call in the ReAct loop
+    http_client = httpx.Client(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60.0),
+        timeout=60.0,
+    )
+    atexit.register(http_client.close)
+    llm = ChatOpenAI(
+        model="gpt-4o-mini",
+        temperature=0.0,
+        api_key=SETTINGS.openai_api_key,
+        http_client=http_client,
+    )
+
+    agent = create_react_agent(llm, tools, prompt)
+    return AgentExecutor(
+        agent=agent,
+        tools=tools,
+        verbose=True,
+        handle_parsing_errors=True,
+    )
+
 
 # -----------------------------------------------------------------------------
 # CLI
@@ -236,10 +623,13 @@ agent_executor = AgentExecutor(
 if __name__ == "__main__":
     import argparse
 
+    signal.signal(signal.SIGTERM, _on_sigterm)
+
     parser = argparse.ArgumentParser(description="Cisco IOS network assistant via LLM agent")
     parser.add_argument("query", nargs="*", help="User query (default: 'バージョン情報を教えて')")
     args = parser.parse_args()
 
     user_input = " ".join(args.query) or "バージョン情報を教えて"
+    agent_executor = _build_agent()
     res = agent_executor.invoke({"input": user_input})
     print(res["output"])
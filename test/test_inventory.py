@@ -0,0 +1,39 @@
+import pytest
+import yaml
+
+from jupetta.inventory import parse_device_yaml
+
+# README の devices.yaml と同じ形
+README_INVENTORY = """\
+- device_type: cisco_ios
+  host: 192.168.1.1
+  username: admin
+  password: password
+"""
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        README_INVENTORY,
+        README_INVENTORY + "  port: 22\n  fast_cli: false\n",
+        "# inventory\n" + README_INVENTORY + "- device_type: cisco_ios\n  host: 10.0.0.1  # lab\n",
+        README_INVENTORY.replace("password: password", 'password: "0123"'),
+        README_INVENTORY.replace("password: password", 'password: "p #1"'),
+        README_INVENTORY.replace("password: password", "password: 'it''s'"),
+        README_INVENTORY.replace("password: password", "password: p#1"),
+        README_INVENTORY.replace("password: password", "password: 0123"),
+        README_INVENTORY.replace("password: password", "password: yes"),
+        README_INVENTORY.replace("password: password", "password: ~"),
+        README_INVENTORY.replace("password: password", "password: 1.5"),
+        README_INVENTORY + "  opts:\n    global_delay_factor: 2\n",
+        "",
+    ],
+)
+def test_matches_safe_load(text):
+    assert parse_device_yaml(text) == yaml.safe_load(text)
+
+
+def test_quoted_credentials_stay_strings():
+    text = README_INVENTORY.replace("password: password", 'password: "0123"')
+    assert parse_device_yaml(text)[0]["password"] == "0123"
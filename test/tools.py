@@ -1,21 +1,47 @@
 import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
 from langchain import hub
-import random
 from datetime import datetime
 from langchain.tools import BaseTool
 from datetime import timedelta
 from zoneinfo import ZoneInfo
 from langchain_openai import ChatOpenAI
 from langchain.agents import AgentExecutor, create_react_agent
-from dotenv import load_dotenv
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
-load_dotenv()
-openai_api_key = os.getenv("OPENAI_API_KEY")
+TZ_TOKYO = ZoneInfo("Asia/Tokyo")
+ROOT_DIR = Path(__file__).resolve().parent.parent
 
-prompt = hub.pull("hwchase17/react")
 
-print(prompt.template)
+class Settings(BaseSettings):
+    model_config = SettingsConfigDict(env_file=ROOT_DIR / ".env", extra="allow", frozen=True)
+
+    openai_api_key: Optional[str] = None
+
+
+SETTINGS = Settings()
+
+# langchain / OpenAI SDK が os.environ から読む .env の値 (LANGCHAIN_API_KEY など) を渡す
+for _key, _value in (SETTINGS.model_extra or {}).items():
+    os.environ.setdefault(_key.upper(), str(_value))
+
+
+@lru_cache(maxsize=None)
+def get_prompt(name="hwchase17/react"):
+    return hub.pull(name)
+
+
+# 運勢のリスト
+FORTUNES = ["大吉", "中吉", "小吉", "吉", "末吉", "凶", "大凶"]
+
+# 運勢の重み付け（大吉と大凶の確率を低くする）
+WEIGHTS = [1, 3, 3, 4, 3, 2, 1]
+
+# 重みの数だけ運勢を並べたテーブル（長さ 17）
+_FORTUNE_POOL = tuple(f for f, w in zip(FORTUNES, WEIGHTS) for _ in range(w))
 
 
 def get_fortune(date_string):
@@ -24,17 +50,9 @@ def get_fortune(date_string):
     except ValueError:
         return "無効な日付形式です。'X月X日'の形式で入力してください。"
 
-    # 運勢のリスト
-    fortunes = ["大吉", "中吉", "小吉", "吉", "末吉", "凶", "大凶"]
-
-    # 運勢の重み付け（大吉と大凶の確率を低くする）
-    weights = [1, 3, 3, 4, 3, 2, 1]
-
-    # 日付に基づいてシードを設定（同じ日付なら同じ運勢を返す）
-    random.seed(date.month * 100 + date.day)
-
-    # 運勢をランダムに選択
-    fortune = random.choices(fortunes, weights=weights)[0]
+    # 日付からテーブルの位置を決める（同じ日付なら同じ運勢を返す）
+    idx = (date.month * 100 + date.day) % len(_FORTUNE_POOL)
+    fortune = _FORTUNE_POOL[idx]
 
     return f"{date_string}の運勢は【{fortune}】です。"
 
@@ -52,17 +70,15 @@ class Get_fortune(BaseTool):
         raise NotImplementedError("does not support async")
 
 
+# 対象日ごとの日数差
+_DELTAS = {"今日": 0, "明日": 1, "明後日": 2}
+
+
 def get_date(date):
-    date_now = datetime.now(ZoneInfo("Asia/Tokyo"))
-    if "今日" in date:
-        date_delta = 0
-    elif "明日" in date:
-        date_delta = 1
-    elif "明後日" in date:
-        date_delta = 2
-    else:
-        return "サポートしていません"
-    return (date_now + timedelta(days=date_delta)).strftime("%m月%d日")
+    for key, date_delta in _DELTAS.items():
+        if key in date:
+            return (datetime.now(TZ_TOKYO) + timedelta(days=date_delta)).strftime("%m月%d日")
+    return "サポートしていません"
 
 
 class Get_date(BaseTool):
@@ -78,24 +94,28 @@ class Get_date(BaseTool):
         raise NotImplementedError("does not support async")
 
 
-# モデルの設定
-model = ChatOpenAI(model="gpt-4o-mini")
+if __name__ == "__main__":
+    prompt = get_prompt()
+    print(prompt.template)
 
-# ツールのリスト
-tools = [Get_date(), Get_fortune()]
+    # モデルの設定
+    model = ChatOpenAI(model="gpt-4o-mini", api_key=SETTINGS.openai_api_key)
 
-# エージェントの作成
-agent = create_react_agent(model, tools, prompt)
+    # ツールのリスト
+    tools = [Get_date(), Get_fortune()]
 
-agent_executor = AgentExecutor(
-    agent=agent,
-    tools=tools,
-    verbose=True,
-    handle_parsing_errors=True,
-)
+    # エージェントの作成
+    agent = create_react_agent(model, tools, prompt)
+
+    agent_executor = AgentExecutor(
+        agent=agent,
+        tools=tools,
+        verbose=True,
+        handle_parsing_errors=True,
+    )
 
-# 入力メッセージの作成と実行
-response = agent_executor.invoke({"input": "今日の運勢を教えてください。"})
+    # 入力メッセージの作成と実行
+    response = agent_executor.invoke({"input": "今日の運勢を教えてください。"})
 
-print("\n結果:")
-print(response["output"])
+    print("\n結果:")
+    print(response["output"])